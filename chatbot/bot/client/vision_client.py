@@ -4,6 +4,8 @@ from pathlib import Path
 import tempfile
 import os
 
+from entities.document import Document
+
 logger = logging.getLogger(__name__)
 
 
@@ -272,7 +274,7 @@ class ImageProcessor:
     Utility class for image processing and management.
     """
 
-    SUPPORTED_FORMATS = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp']
+    SUPPORTED_FORMATS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'})
 
     @staticmethod
     def is_supported_image(file_path: str) -> bool:
@@ -371,7 +373,6 @@ class MultimodalRAG:
 
             # Store in vector database if there's extracted text
             if extracted_text.strip():
-                from entities.document import Document
                 image_doc = Document(
                     page_content=f"Image content: {extracted_text}\nDescription: {description}",
                     metadata={
@@ -2,16 +2,28 @@ from typing import Any
 
 import sentence_transformers
 
+# Loaded models shared by every Embedder built with default loading options
+_MODEL_CACHE: dict[tuple[str, str | None], sentence_transformers.SentenceTransformer] = {}
+
 
 class Embedder:
     def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_folder: str | None = None, **kwargs: Any):
         """
         Initialize the Embedder class with the specified parameters.
 
+        Models loaded without extra keyword arguments are cached per process and shared between instances.
+
         Args:
             **kwargs (Any): Additional keyword arguments to pass to the SentenceTransformer model.
         """
-        self.client = sentence_transformers.SentenceTransformer(model_name, cache_folder=cache_folder, **kwargs)
+        if kwargs:
+            # Custom loading options make the model instance-specific, so it is not shared
+            self.client = sentence_transformers.SentenceTransformer(model_name, cache_folder=cache_folder, **kwargs)
+        else:
+            key = (model_name, cache_folder)
+            if key not in _MODEL_CACHE:
+                _MODEL_CACHE[key] = sentence_transformers.SentenceTransformer(model_name, cache_folder=cache_folder)
+            self.client = _MODEL_CACHE[key]
 
     def embed_documents(self, texts: list[str], multi_process: bool = False, **encode_kwargs: Any) -> list[list[float]]:
         """
@@ -32,6 +44,8 @@ class Embedder:
             embeddings = self.client.encode_multi_process(texts, pool)
             sentence_transformers.SentenceTransformer.stop_multi_process_pool(pool)
         else:
+            # GPUs stay underused at the library's CPU-oriented default of 32
+            encode_kwargs.setdefault("batch_size", 128 if self.client.device.type == "cuda" else 32)
             embeddings = self.client.encode(texts, show_progress_bar=True, **encode_kwargs)
 
         return embeddings.tolist()
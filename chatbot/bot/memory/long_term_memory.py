@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 import os
@@ -24,10 +25,12 @@ class MemoryItem:
     importance_score: float = 0.5
 
     def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.last_accessed is None:
-            self.last_accessed = datetime.now()
+        if self.created_at is None or self.last_accessed is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.last_accessed is None:
+                self.last_accessed = now
 
 
 class MemoryBackend(ABC):
@@ -66,6 +69,9 @@ class FileMemoryBackend(MemoryBackend):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
         self.embedder = None
+        # Parsed memory records per user, keyed by the (mtime, size) of the file they were read from.
+        # Records are kept private; every load builds fresh MemoryItem objects from them.
+        self._memory_cache: Dict[str, tuple[tuple[int, int], List[Dict[str, Any]]]] = {}
         self._initialize_embedder()
 
     def _initialize_embedder(self):
@@ -113,17 +119,14 @@ class FileMemoryBackend(MemoryBackend):
                 return []
 
             # Simple relevance scoring based on text overlap
-            query_lower = query.lower()
+            query_words = set(query.lower().split())
             scored_memories = []
 
             for memory in memories:
-                content_lower = memory.content.lower()
                 relevance_score = 0.0
 
-                # Simple word overlap scoring
-                query_words = set(query_lower.split())
-                content_words = set(content_lower.split())
-                overlap = len(query_words.intersection(content_words))
+                # Simple word overlap scoring, deduplicated by the query word set
+                overlap = len(query_words.intersection(memory.content.lower().split()))
 
                 if overlap > 0:
                     relevance_score = overlap / len(query_words)
@@ -136,9 +139,10 @@ class FileMemoryBackend(MemoryBackend):
             scored_memories.sort(key=lambda x: (x[1], x[0].last_accessed), reverse=True)
 
             # Update access information
+            now = datetime.now()
             result = []
             for memory, score in scored_memories[:limit]:
-                memory.last_accessed = datetime.now()
+                memory.last_accessed = now
                 memory.access_count += 1
                 result.append(memory)
 
@@ -188,29 +192,48 @@ class FileMemoryBackend(MemoryBackend):
             logger.error(f"Error during cleanup: {e}")
             return 0
 
+    @staticmethod
+    def _file_signature(user_file: Path) -> tuple[int, int]:
+        """Return the (mtime, size) pair used to tell whether a memory file changed on disk."""
+        stat = user_file.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _memory_from_record(record: Dict[str, Any]) -> MemoryItem:
+        """Build a MemoryItem that shares no mutable state with the cached record."""
+        item = dict(record)
+        item['metadata'] = copy.deepcopy(record['metadata'])
+        if record.get('embedding') is not None:
+            item['embedding'] = list(record['embedding'])
+        return MemoryItem(**item)
+
     def _load_memories(self, user_id: str) -> List[MemoryItem]:
-        """Load memories from file."""
+        """Load memories from file, reusing the parsed records while the file is unchanged."""
         user_file = self._get_user_file(user_id)
 
-        if not user_file.exists():
-            return []
-
         try:
-            with open(user_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            signature = self._file_signature(user_file)
+            cached = self._memory_cache.get(user_id)
+            if cached is not None and cached[0] == signature:
+                return [self._memory_from_record(record) for record in cached[1]]
 
-            memories = []
-            for item in data:
-                # Convert datetime strings back to datetime objects
-                if 'created_at' in item:
-                    item['created_at'] = datetime.fromisoformat(item['created_at'])
-                if 'last_accessed' in item:
-                    item['last_accessed'] = datetime.fromisoformat(item['last_accessed'])
+            # json.loads decodes UTF-8 bytes itself, so skip the text-IO layer
+            records = json.loads(user_file.read_bytes())
 
-                memories.append(MemoryItem(**item))
+            for record in records:
+                # Convert datetime strings back to datetime objects
+                if 'created_at' in record:
+                    record['created_at'] = datetime.fromisoformat(record['created_at'])
+                if 'last_accessed' in record:
+                    record['last_accessed'] = datetime.fromisoformat(record['last_accessed'])
 
+            memories = [self._memory_from_record(record) for record in records]
+            self._memory_cache[user_id] = (signature, records)
             return memories
 
+        except FileNotFoundError:
+            # No memories stored yet for this user
+            return []
         except Exception as e:
             logger.error(f"Error loading memories: {e}")
             return []
@@ -219,10 +242,13 @@ class FileMemoryBackend(MemoryBackend):
         """Save memories to file."""
         user_file = self._get_user_file(user_id)
 
+        # asdict deep-copies, so the records don't alias the caller's MemoryItem objects
+        records = [asdict(memory) for memory in memories]
+
         # Convert to serializable format
         data = []
-        for memory in memories:
-            memory_dict = asdict(memory)
+        for record in records:
+            memory_dict = dict(record)
             # Convert datetime objects to ISO strings
             if memory_dict['created_at']:
                 memory_dict['created_at'] = memory_dict['created_at'].isoformat()
@@ -230,8 +256,13 @@ class FileMemoryBackend(MemoryBackend):
                 memory_dict['last_accessed'] = memory_dict['last_accessed'].isoformat()
             data.append(memory_dict)
 
+        # Drop the cached copy first so a failed write can't leave it out of sync with the file
+        self._memory_cache.pop(user_id, None)
+        # Serialize up front so the file gets one write instead of one per JSON token
+        payload = json.dumps(data, indent=2, ensure_ascii=False)
         with open(user_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write(payload)
+        self._memory_cache[user_id] = (self._file_signature(user_file), records)
 
 
 class Mem0MemoryBackend(MemoryBackend):
@@ -336,6 +367,20 @@ class LongTermMemory:
     Provides persistent memory across sessions.
     """
 
+    # Base importance score per memory type
+    TYPE_SCORES = {
+        "preference": 0.8,
+        "fact": 0.7,
+        "conversation": 0.4,
+        "conversation_summary": 0.6
+    }
+
+    # Keywords that indicate importance
+    IMPORTANT_KEYWORDS = [
+        "always", "never", "prefer", "favorite", "hate", "love",
+        "important", "remember", "key", "critical", "essential"
+    ]
+
     def __init__(
         self,
         backend: str = "file",
@@ -381,7 +426,8 @@ class LongTermMemory:
         user_id: str,
         content: str,
         memory_type: str = "conversation",
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        importance: Optional[float] = None
     ) -> bool:
         """
         Store a new memory.
@@ -391,6 +437,7 @@ class LongTermMemory:
             content: Memory content
             memory_type: Type of memory (conversation, preference, fact, etc.)
             metadata: Additional metadata
+            importance: Precomputed importance score (computed from the content if None)
 
         Returns:
             Success status
@@ -398,7 +445,8 @@ class LongTermMemory:
         metadata = metadata or {}
 
         # Calculate importance score
-        importance = self._calculate_importance(content, memory_type)
+        if importance is None:
+            importance = self._calculate_importance(content, memory_type)
 
         memory = MemoryItem(
             user_id=user_id,
@@ -529,28 +577,12 @@ class LongTermMemory:
         Returns:
             Importance score (0-1)
         """
-        base_score = 0.5
-
         # Type-based scoring
-        type_scores = {
-            "preference": 0.8,
-            "fact": 0.7,
-            "conversation": 0.4,
-            "conversation_summary": 0.6
-        }
-
-        base_score = type_scores.get(memory_type, 0.5)
+        base_score = self.TYPE_SCORES.get(memory_type, 0.5)
 
         # Content-based scoring
         content_lower = content.lower()
-
-        # Keywords that indicate importance
-        important_keywords = [
-            "always", "never", "prefer", "favorite", "hate", "love",
-            "important", "remember", "key", "critical", "essential"
-        ]
-
-        keyword_matches = sum(1 for keyword in important_keywords if keyword in content_lower)
+        keyword_matches = sum(1 for keyword in self.IMPORTANT_KEYWORDS if keyword in content_lower)
         keyword_boost = min(keyword_matches * 0.1, 0.3)
 
         # Length-based scoring (longer content might be more important)
@@ -624,7 +656,8 @@ class MemoryManager:
                 user_id=user_id,
                 content=content,
                 memory_type="conversation",
-                metadata={"importance": importance}
+                metadata={"importance": importance},
+                importance=importance
             )
 
     def get_memory_context(self, user_id: str, current_query: str, max_memories: int = 3) -> str:
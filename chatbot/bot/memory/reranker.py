@@ -48,6 +48,8 @@ class Reranker:
         try:
             from flashrank import Ranker, RerankRequest
             self.ranker = Ranker(model_name=self.model_name)
+            # Keep the request class so reranking doesn't re-import flashrank on every call
+            self._rerank_request_cls = RerankRequest
             self.rerank_method = self._rerank_flashrank
             logger.info(f"Initialized FlashRank reranker with model: {self.model_name}")
         except ImportError:
@@ -101,13 +103,11 @@ class Reranker:
         **kwargs
     ) -> List[Document]:
         """Rerank using FlashRank."""
-        from flashrank import RerankRequest
-
         # Convert documents to passages format
         passages = [{"text": doc.page_content} for doc in documents]
 
         # Create rerank request
-        request = RerankRequest(query=query, passages=passages)
+        request = self._rerank_request_cls(query=query, passages=passages)
 
         # Perform reranking
         results = self.ranker.rerank(request, **kwargs)
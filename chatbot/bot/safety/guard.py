@@ -31,6 +31,31 @@ class SafetyGuard:
         "Privacy Violation"
     ]
 
+    # Keywords checked by the simple keyword-based backend
+    DANGEROUS_PATTERNS = {
+        SafetyCategory.VIOLENCE_HATE: [
+            "kill", "murder", "hate", "racist", "violent", "attack", "bomb",
+            "terrorism", "extremist", "supremacist"
+        ],
+        SafetyCategory.SEXUAL_CONTENT: [
+            "sexual abuse", "child exploitation", "porn", "rape", "molest"
+        ],
+        SafetyCategory.CRIMINAL_PLANNING: [
+            "how to", "hack", "steal", "fraud", "launder money", "drug",
+            "illegal", "crime", "break in", "robbery"
+        ],
+        SafetyCategory.GUNS_WEAPONS: [
+            "gun", "weapon", "bomb", "explosive", "firearm", "shoot"
+        ],
+        SafetyCategory.SELF_HARM: [
+            "suicide", "kill myself", "self-harm", "cutting", "overdose"
+        ],
+        SafetyCategory.PRIVACY_VIOLATION: [
+            "personal information", "ssn", "social security", "password",
+            "confidential", "private data"
+        ]
+    }
+
     def __init__(self, model_path: Optional[str] = None, backend: str = "llama_guard"):
         """
         Initialize the safety guard.
@@ -142,36 +167,11 @@ class SafetyGuard:
         """Simple keyword-based classification."""
         text_lower = text.lower()
 
-        # Define dangerous keywords and patterns
-        dangerous_patterns = {
-            SafetyCategory.VIOLENCE_HATE: [
-                "kill", "murder", "hate", "racist", "violent", "attack", "bomb",
-                "terrorism", "extremist", "supremacist"
-            ],
-            SafetyCategory.SEXUAL_CONTENT: [
-                "sexual abuse", "child exploitation", "porn", "rape", "molest"
-            ],
-            SafetyCategory.CRIMINAL_PLANNING: [
-                "how to", "hack", "steal", "fraud", "launder money", "drug",
-                "illegal", "crime", "break in", "robbery"
-            ],
-            SafetyCategory.GUNS_WEAPONS: [
-                "gun", "weapon", "bomb", "explosive", "firearm", "shoot"
-            ],
-            SafetyCategory.SELF_HARM: [
-                "suicide", "kill myself", "self-harm", "cutting", "overdose"
-            ],
-            SafetyCategory.PRIVACY_VIOLATION: [
-                "personal information", "ssn", "social security", "password",
-                "confidential", "private data"
-            ]
-        }
-
         detected_categories = []
         max_score = 0.0
 
         # Check for dangerous patterns
-        for category, patterns in dangerous_patterns.items():
+        for category, patterns in self.DANGEROUS_PATTERNS.items():
             matches = sum(1 for pattern in patterns if pattern in text_lower)
             if matches > 0:
                 score = min(matches * 0.3, 1.0)  # Cap at 1.0
@@ -1,7 +1,10 @@
+import concurrent.futures
 import logging
 from typing import List, Dict, Any, Optional
 import os
 
+from entities.document import Document
+
 logger = logging.getLogger(__name__)
 
 
@@ -135,7 +138,8 @@ class GoogleSearchTool:
         self,
         query: str,
         num_results: int = 3,
-        fetch_content: bool = True
+        fetch_content: bool = True,
+        max_workers: int = 4
     ) -> List[Dict[str, Any]]:
         """
         Perform search and optionally fetch full content of results.
@@ -144,6 +148,7 @@ class GoogleSearchTool:
             query: Search query
             num_results: Number of results to process
             fetch_content: Whether to fetch full article content
+            max_workers: Maximum number of articles to download concurrently
 
         Returns:
             List of search results with optional full content
@@ -151,10 +156,17 @@ class GoogleSearchTool:
         search_results = self.search(query, num_results)
 
         if fetch_content:
-            for result in search_results:
-                if result.get("link"):
-                    content = self.fetch_article_content(result["link"])
-                    result["full_content"] = content
+            linked_results = [result for result in search_results if result.get("link")]
+            if linked_results:
+                # Articles are independent downloads, so fetch them concurrently; `map` keeps the result order.
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(linked_results))
+                ) as executor:
+                    contents = executor.map(
+                        lambda result: self.fetch_article_content(result["link"]), linked_results
+                    )
+                    for result, content in zip(linked_results, contents):
+                        result["full_content"] = content
 
         return search_results
 
@@ -206,15 +218,30 @@ class SearchAugmentedRAG:
         Returns:
             Tuple of (documents, sources) where sources indicate local vs web
         """
-        # Retrieve from local knowledge base
-        local_docs, local_sources = self.vector_db.similarity_search_with_threshold(
-            query=query, k=local_k
-        )
+        # Local and web retrieval are independent, so run them concurrently
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        try:
+            # Retrieve from local knowledge base
+            local_future = executor.submit(
+                self.vector_db.similarity_search_with_threshold, query=query, k=local_k
+            )
 
-        # Search web for additional information
-        web_results = self.search_tool.search_and_fetch_content(
-            query=query, num_results=web_k, fetch_content=True
-        )
+            # Search web for additional information
+            web_future = executor.submit(
+                self.search_tool.search_and_fetch_content,
+                query=query, num_results=web_k, fetch_content=True
+            )
+
+            try:
+                local_docs, local_sources = local_future.result()
+            except Exception:
+                # Fail fast like the sequential version: don't wait for the web downloads
+                web_future.cancel()
+                raise
+            web_results = web_future.result()
+        finally:
+            # Both futures are done on success; on failure a running web search is left to finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # Convert web results to Document format
         web_docs = []
@@ -222,8 +249,6 @@ class SearchAugmentedRAG:
         for result in web_results:
             content = result.get("full_content", result.get("snippet", ""))
             if content:
-                from entities.document import Document
-
                 web_doc = Document(
                     page_content=content,
                     metadata={
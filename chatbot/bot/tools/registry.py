@@ -4,6 +4,9 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Characters accepted by the calculator tool
+CALCULATOR_ALLOWED_CHARS = frozenset("0123456789+-*/(). ")
+
 
 class Tool:
     """
@@ -178,8 +181,7 @@ def calculate(expression: str) -> str:
     """
     try:
         # Basic security: only allow safe mathematical operations
-        allowed_chars = set("0123456789+-*/(). ")
-        if not all(c in allowed_chars for c in expression):
+        if not CALCULATOR_ALLOWED_CHARS.issuperset(expression):
             return "Error: Only basic mathematical operations are allowed"
 
         result = eval(expression, {"__builtins__": {}})
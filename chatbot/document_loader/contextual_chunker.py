@@ -1,5 +1,7 @@
 import logging
 from typing import List, Optional, Dict, Any
+
+import numpy as np
 from entities.document import Document
 
 logger = logging.getLogger(__name__)
@@ -197,13 +199,13 @@ class LateChunkingEmbedder:
         # Split into chunks
         chunks = self._split_document(document, chunk_size, overlap)
 
-        # Compute contextual embeddings for each chunk
-        chunk_embeddings = []
-        for chunk in chunks:
-            chunk_emb = self._compute_contextual_embedding(
-                chunk, full_embedding, document
-            )
-            chunk_embeddings.append(chunk_emb)
+        if not chunks:
+            return chunks, []
+
+        # Encode all chunks in one batch rather than one model call per chunk
+        chunk_embeddings = self._compute_contextual_embeddings(
+            self.model.encode(chunks), full_embedding
+        )
 
         return chunks, chunk_embeddings
 
@@ -249,29 +251,23 @@ class LateChunkingEmbedder:
 
         return chunks
 
-    def _compute_contextual_embedding(
+    def _compute_contextual_embeddings(
         self,
-        chunk: str,
-        full_doc_embedding: List[float],
-        full_document: str
-    ) -> List[float]:
+        chunk_embeddings: List[List[float]],
+        full_doc_embedding: List[float]
+    ) -> List[List[float]]:
         """
-        Compute contextual embedding for a chunk using full document context.
+        Compute contextual embeddings for chunks using the full document embedding.
         """
-        # Simple approach: combine chunk embedding with full document embedding
-        chunk_embedding = self.model.encode(chunk)
-
         # Weighted combination - give more weight to chunk-specific embedding
         chunk_weight = 0.7
         doc_weight = 0.3
 
-        contextual_embedding = []
-        for chunk_val, doc_val in zip(chunk_embedding, full_doc_embedding):
-            contextual_embedding.append(
-                chunk_weight * chunk_val + doc_weight * doc_val
-            )
+        contextual_embeddings = (
+            chunk_weight * np.asarray(chunk_embeddings) + doc_weight * np.asarray(full_doc_embedding)
+        )
 
-        return contextual_embedding
+        return contextual_embeddings.tolist()
 
     def is_available(self) -> bool:
         """Check if the late chunking embedder is available."""
@@ -337,17 +333,18 @@ class EnhancedTextSplitter:
         if self.use_contextual and self.contextual_chunker:
             chunks = self.contextual_chunker.process_chunks(chunks, document)
 
+        # Metadata shared by every chunk of the document is built once; each chunk only adds its own fields
+        shared_metadata = {
+            **(metadata or {}),
+            "total_chunks": len(chunks),
+            "contextual": self.use_contextual,
+            "late_chunking": self.use_late_chunking
+        }
+
         # Create Document objects
         documents = []
         for i, chunk in enumerate(chunks):
-            doc_metadata = metadata.copy() if metadata else {}
-            doc_metadata.update({
-                "chunk_index": i,
-                "total_chunks": len(chunks),
-                "chunk_size": len(chunk),
-                "contextual": self.use_contextual,
-                "late_chunking": self.use_late_chunking
-            })
+            doc_metadata = {**shared_metadata, "chunk_index": i, "chunk_size": len(chunk)}
 
             # Add embedding if computed
             if self.use_late_chunking and 'embeddings' in locals():
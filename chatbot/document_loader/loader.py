@@ -45,9 +45,10 @@ class DirectoryLoader:
 
     def load(self) -> list[Document]:
         """Load documents."""
-        if not self.path.exists():
-            raise FileNotFoundError(f"Directory not found: '{self.path}'")
+        # One stat on the happy path; exists() is only needed to pick the error
         if not self.path.is_dir():
+            if not self.path.exists():
+                raise FileNotFoundError(f"Directory not found: '{self.path}'")
             raise ValueError(f"Expected directory, got file: '{self.path}'")
 
         docs: list[Document] = []
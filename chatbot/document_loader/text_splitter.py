@@ -26,6 +26,7 @@ import copy
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Any, Callable, Iterable
 
 from entities.document import Document
@@ -123,7 +124,11 @@ class TextSplitter(ABC):
         # We now want to combine these smaller pieces into medium size
         # chunks to send to the LLM.
         separator_len = self._length_function(separator)
-        docs, current_doc = [], []
+        # `current_doc` is a sliding window over the splits: new splits are appended on the right and the overlap
+        # is trimmed from the left, so deques avoid re-copying the whole window on every pop.
+        docs, current_doc = [], deque()
+        # Lengths of the splits in `current_doc`, measured once so they don't have to be re-measured when popped.
+        current_lens = deque()
         total = 0
 
         for d in splits:
@@ -143,9 +148,11 @@ class TextSplitter(ABC):
                     while total > self._chunk_overlap or (
                         total + _len + (separator_len if len(current_doc) > 0 else 0) > self._chunk_size and total > 0
                     ):
-                        total -= self._length_function(current_doc[0]) + (separator_len if len(current_doc) > 1 else 0)
-                        current_doc = current_doc[1:]
+                        total -= current_lens[0] + (separator_len if len(current_doc) > 1 else 0)
+                        current_doc.popleft()
+                        current_lens.popleft()
             current_doc.append(d)
+            current_lens.append(_len)
             total += _len + (separator_len if len(current_doc) > 1 else 0)
         doc = self._join_docs(current_doc, separator)
         if doc is not None:
@@ -172,6 +179,11 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         super().__init__(keep_separator=keep_separator, **kwargs)
         self._separators = separators or ["\n\n", "\n", " ", ""]
         self._is_separator_regex = is_separator_regex
+        # Compile regex separators once instead of on every recursive `_split_text` call. Literal separators
+        # don't need a pattern: a plain substring test is enough to know whether they occur in the text.
+        self._separator_patterns = (
+            {s: re.compile(s) for s in self._separators if s} if is_separator_regex else {}
+        )
 
     def _split_text(self, text: str, separators: list[str]) -> list[str]:
         """
@@ -190,11 +202,14 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         separator = separators[-1]
         new_separators = []
         for i, _s in enumerate(separators):
-            _separator = _s if self._is_separator_regex else re.escape(_s)
             if _s == "":
                 separator = _s
                 break
-            if re.search(_separator, text):
+            if self._is_separator_regex:
+                found = self._separator_patterns[_s].search(text) is not None
+            else:
+                found = _s in text
+            if found:
                 separator = _s
                 new_separators = separators[i + 1 :]
                 break
@@ -245,10 +260,11 @@ class RecursiveCharacterTextSplitter(TextSplitter):
             if keep_separator:
                 # The parentheses in the pattern keep the delimiters in the result.
                 _splits = re.split(f"({separator})", text)
-                splits = [_splits[i] + _splits[i + 1] for i in range(1, len(_splits), 2)]
+                # Build the result in place rather than concatenating intermediate lists.
+                splits = [_splits[0]]
+                splits.extend(_splits[i] + _splits[i + 1] for i in range(1, len(_splits) - 1, 2))
                 if len(_splits) % 2 == 0:
-                    splits += _splits[-1:]
-                splits = [_splits[0]] + splits
+                    splits.append(_splits[-1])
             else:
                 splits = re.split(separator, text)
         else:
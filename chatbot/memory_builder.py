@@ -75,8 +75,7 @@ def split_chunks(
         splitter = create_recursive_text_splitter(
             format=Format.MARKDOWN.value, chunk_size=chunk_size, chunk_overlap=chunk_overlap
         )
-        for chunk in splitter.split_documents(sources):
-            chunks.append(chunk)
+        chunks = splitter.split_documents(sources)
 
     return chunks
 
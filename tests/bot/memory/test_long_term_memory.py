@@ -0,0 +1,69 @@
+import json
+
+import pytest
+from bot.memory import long_term_memory
+from bot.memory.long_term_memory import FileMemoryBackend, MemoryItem
+
+
+@pytest.fixture
+def file_backend(tmp_path, monkeypatch):
+    # Skip loading the sentence transformer; these tests only exercise the file cache
+    monkeypatch.setattr(FileMemoryBackend, "_initialize_embedder", lambda self: None)
+    return FileMemoryBackend(storage_path=str(tmp_path))
+
+
+def make_memory(content: str = "I like green tea") -> MemoryItem:
+    return MemoryItem(user_id="user", memory_type="preference", content=content, metadata={"source": "chat"})
+
+
+def test_load_memories_reuses_parsed_file_while_unchanged(file_backend, monkeypatch):
+    file_backend.store(make_memory())
+    file_backend._memory_cache.clear()
+
+    calls = []
+    original_loads = long_term_memory.json.loads
+    monkeypatch.setattr(long_term_memory.json, "loads", lambda *args: calls.append(args) or original_loads(*args))
+
+    first = file_backend.get_all("user")
+    second = file_backend.get_all("user")
+
+    assert len(calls) == 1
+    assert [m.content for m in first] == [m.content for m in second] == ["I like green tea"]
+    assert first[0] is not second[0]
+
+
+def test_load_memories_refreshes_after_external_write(file_backend):
+    file_backend.store(make_memory())
+    assert [m.content for m in file_backend.get_all("user")] == ["I like green tea"]
+
+    user_file = file_backend._get_user_file("user")
+    data = json.loads(user_file.read_text(encoding="utf-8"))
+    data[0]["content"] = "I switched to black coffee"
+    user_file.write_text(json.dumps(data), encoding="utf-8")
+
+    assert [m.content for m in file_backend.get_all("user")] == ["I switched to black coffee"]
+
+
+def test_stored_memory_mutation_does_not_leak_into_cache(file_backend):
+    memory = make_memory()
+    file_backend.store(memory)
+
+    memory.content = "changed after store"
+    memory.metadata["source"] = "changed"
+
+    loaded = file_backend.get_all("user")
+    assert loaded[0].content == "I like green tea"
+    assert loaded[0].metadata == {"source": "chat"}
+
+
+def test_loaded_memory_mutation_does_not_leak_into_cache(file_backend):
+    file_backend.store(make_memory())
+
+    loaded = file_backend.get_all("user")
+    loaded[0].content = "changed after load"
+    loaded[0].metadata["x"] = 1
+    loaded.append(make_memory("extra"))
+
+    reloaded = file_backend.get_all("user")
+    assert [m.content for m in reloaded] == ["I like green tea"]
+    assert reloaded[0].metadata == {"source": "chat"}
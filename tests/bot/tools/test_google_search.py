@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+from bot.tools.google_search import GoogleSearchTool, SearchAugmentedRAG
+from entities.document import Document
+
+
+class FakeVectorDatabase:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+
+    def similarity_search_with_threshold(self, query: str, k: int = 3):
+        if self.error:
+            raise self.error
+        return [Document(page_content="local content", metadata={"source": "local.md"})], [{"source": "local"}]
+
+
+class FakeSearchTool:
+    def __init__(self, release: threading.Event | None = None):
+        self.release = release
+        self.calls = 0
+
+    def search_and_fetch_content(self, query: str, num_results: int = 3, fetch_content: bool = True):
+        self.calls += 1
+        if self.release:
+            # Stands in for slow article downloads
+            self.release.wait(timeout=5)
+        return [{"title": "Result", "link": "https://example.com", "snippet": "snippet", "full_content": "web content"}]
+
+
+def test_retrieve_augmented_combines_local_and_web_results():
+    search_tool = FakeSearchTool()
+    rag = SearchAugmentedRAG(vector_db=FakeVectorDatabase(), search_tool=search_tool)
+
+    docs, sources = rag.retrieve_augmented("query")
+
+    assert [doc.page_content for doc in docs] == ["local content", "web content"]
+    assert docs[1].metadata["source"] == "https://example.com"
+    assert sources[0] == {"source": "local"}
+    assert sources[1]["source"] == "web_search"
+    assert search_tool.calls == 1
+
+
+def test_retrieve_augmented_local_failure_does_not_wait_for_web_search():
+    release = threading.Event()
+    rag = SearchAugmentedRAG(
+        vector_db=FakeVectorDatabase(error=RuntimeError("vector store unavailable")),
+        search_tool=FakeSearchTool(release=release),
+    )
+
+    start = time.monotonic()
+    try:
+        with pytest.raises(RuntimeError, match="vector store unavailable"):
+            rag.retrieve_augmented("query")
+        assert time.monotonic() - start < 2
+    finally:
+        release.set()
+
+
+def test_search_and_fetch_content_fetches_articles_concurrently_in_order(monkeypatch):
+    search_tool = GoogleSearchTool(api_key="test-key")
+    results = [
+        {"title": "First", "link": "https://example.com/1"},
+        {"title": "No link", "link": ""},
+        {"title": "Second", "link": "https://example.com/2"},
+    ]
+    monkeypatch.setattr(search_tool, "search", lambda query, num_results: results)
+
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fetch_article_content(url: str, timeout: int = 10) -> str:
+        # Only returns once both downloads are in flight at the same time
+        both_started.wait()
+        return f"content of {url}"
+
+    monkeypatch.setattr(search_tool, "fetch_article_content", fetch_article_content)
+
+    fetched = search_tool.search_and_fetch_content("query", num_results=3)
+
+    assert [result.get("full_content") for result in fetched] == [
+        "content of https://example.com/1",
+        None,
+        "content of https://example.com/2",
+    ]